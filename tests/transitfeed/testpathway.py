@@ -0,0 +1,210 @@
+# Copyright (C) 2007 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Unit tests for the pathway module.
+from __future__ import absolute_import
+
+import transitfeed
+from tests import util
+
+class PathwayObjectTestCase(util.ValidationTestCase):
+  def testDefaultPathwayMode(self):
+    for pathway_mode in ("", None):
+      pathway = transitfeed.Pathway(field_dict={"pathway_id": "P1",
+                                                "from_stop_id": "S1",
+                                                "to_stop_id": "S2",
+                                                "pathway_mode": pathway_mode})
+      self.assertEquals(2, pathway.pathway_mode)
+    pathway = transitfeed.Pathway(field_dict={"pathway_id": "P1",
+                                              "from_stop_id": "S1",
+                                              "to_stop_id": "S2"})
+    self.assertEquals(2, pathway.pathway_mode)
+    pathway = transitfeed.Pathway(pathway_id="P1", from_stop_id="S1",
+                                  to_stop_id="S2")
+    self.assertEquals(2, pathway.pathway_mode)
+    pathway.Validate(self.problems)
+    self.accumulator.AssertNoMoreExceptions()
+
+  def testMalformedValuesAreKept(self):
+    pathway = transitfeed.Pathway(field_dict={"pathway_id": "P1",
+                                              "from_stop_id": "S1",
+                                              "to_stop_id": "S2",
+                                              "pathway_mode": "abc"})
+    self.assertEquals("abc", pathway.pathway_mode)
+    pathway.Validate(self.problems)
+    e = self.accumulator.PopInvalidValue("pathway_mode")
+    self.assertEquals("abc", e.value)
+    self.accumulator.AssertNoMoreExceptions()
+
+    pathway = transitfeed.Pathway(field_dict={"pathway_id": "P1",
+                                              "from_stop_id": "S1",
+                                              "to_stop_id": "S2",
+                                              "pathway_mode": "2",
+                                              "traversal_time": "abc"})
+    self.assertEquals("abc", pathway.traversal_time)
+    pathway.Validate(self.problems)
+    e = self.accumulator.PopInvalidValue("traversal_time")
+    self.assertEquals("abc", e.value)
+    self.accumulator.AssertNoMoreExceptions()
+
+  def testUnhashableValuesAreKept(self):
+    pathway = transitfeed.Pathway(pathway_id="P1", from_stop_id="S1",
+                                  to_stop_id="S2", pathway_mode=[2],
+                                  traversal_time=[60])
+    self.assertEquals([2], pathway.pathway_mode)
+    self.assertEquals([60], pathway.traversal_time)
+    pathway.Validate(self.problems)
+    self.accumulator.PopInvalidValue("pathway_mode")
+    self.accumulator.PopInvalidValue("traversal_time")
+    self.accumulator.AssertNoMoreExceptions()
+
+  def testAllBeforeAddValidatorsRun(self):
+    pathway = transitfeed.Pathway(field_dict={"pathway_id": "P1",
+                                              "from_stop_id": "",
+                                              "to_stop_id": "",
+                                              "pathway_mode": "9"})
+    self.assertFalse(pathway.ValidateBeforeAdd(self.problems))
+    self.accumulator.PopMissingValue("from_stop_id")
+    self.accumulator.PopMissingValue("to_stop_id")
+    self.accumulator.PopInvalidValue("pathway_mode")
+    self.accumulator.AssertNoMoreExceptions()
+
+    pathway = transitfeed.Pathway(field_dict={"pathway_id": "P1",
+                                              "from_stop_id": "S1",
+                                              "to_stop_id": "S2",
+                                              "pathway_mode": "1"})
+    self.assertTrue(pathway.ValidateBeforeAdd(self.problems))
+    self.accumulator.AssertNoMoreExceptions()
+
+  def testPaddedValuesAreParsed(self):
+    pathway = transitfeed.Pathway(field_dict={"pathway_id": "P1",
+                                              "from_stop_id": "S1",
+                                              "to_stop_id": "S2",
+                                              "pathway_mode": " 2 ",
+                                              "traversal_time": " 12 "})
+    self.assertEquals(2, pathway.pathway_mode)
+    self.assertEquals(12, pathway.traversal_time)
+    pathway.Validate(self.problems)
+    self.accumulator.AssertNoMoreExceptions()
+
+  def testMissingTraversalTime(self):
+    pathway = transitfeed.Pathway(field_dict={"pathway_id": "P1",
+                                              "from_stop_id": "S1",
+                                              "to_stop_id": "S2",
+                                              "pathway_mode": "2"})
+    self.assertFalse("traversal_time" in pathway.__dict__)
+    self.assertFalse("traversal_time" in pathway.keys())
+    self.assertEquals(None, pathway.traversal_time)
+    pathway.Validate(self.problems)
+    self.accumulator.AssertNoMoreExceptions()
+
+
+class PathwayDistanceTestCase(util.ValidationTestCase):
+  def setUp(self):
+    util.ValidationTestCase.setUp(self)
+    self.schedule = transitfeed.Schedule()
+    # 1113m appart
+    self.stop1 = self.schedule.AddStop(0, 0, "stop 1")
+    self.stop2 = self.schedule.AddStop(0, 0.01, "stop 2")
+
+  def testDistanceTooBig(self):
+    pathway = transitfeed.Pathway(schedule=self.schedule, pathway_id="P1",
+                                  from_stop_id=self.stop1.stop_id,
+                                  to_stop_id=self.stop2.stop_id,
+                                  pathway_mode="2")
+    self.assertAlmostEqual(1113.19, pathway.GetPathwayDistance(), places=1)
+    pathway.Validate(self.problems)
+    self.accumulator.AssertNoMoreExceptions()
+
+    # About 5.5km appart, a warning
+    self.stop2.stop_lon = 0.05
+    pathway.Validate(self.problems)
+    e = self.accumulator.PopException("PathwayDistanceTooBig")
+    self.assertEquals(e.type, transitfeed.TYPE_WARNING)
+    self.accumulator.AssertNoMoreExceptions()
+
+  def testDistanceFollowsMovedStop(self):
+    pathway = transitfeed.Pathway(schedule=self.schedule, pathway_id="P1",
+                                  from_stop_id=self.stop1.stop_id,
+                                  to_stop_id=self.stop2.stop_id,
+                                  pathway_mode="2")
+    pathway.Validate(self.problems)
+    self.accumulator.AssertNoMoreExceptions()
+
+    # Moving a stop after a first validation must be taken into account. The
+    # stops are now about 22km appart.
+    self.stop2.stop_lat = 0.2
+    self.assertTrue(pathway.GetPathwayDistance() > 20000)
+    pathway.Validate(self.problems)
+    e = self.accumulator.PopException("PathwayDistanceTooBig")
+    self.assertEquals(e.type, transitfeed.TYPE_ERROR)
+    self.accumulator.AssertNoMoreExceptions()
+
+  def testOverriddenValidatorsAreCalled(self):
+    distances = []
+    class RecordingPathway(transitfeed.Pathway):
+      def ValidatePathwayDistance(self, problems, distance=None):
+        distances.append(distance)
+      def ValidatePathwayWalkingTime(self, problems, distance=None):
+        distances.append(distance)
+
+    pathway = RecordingPathway(schedule=self.schedule, pathway_id="P1",
+                               from_stop_id=self.stop1.stop_id,
+                               to_stop_id=self.stop2.stop_id,
+                               pathway_mode="2")
+    pathway.Validate(self.problems)
+    self.assertEquals(2, len(distances))
+    self.assertAlmostEqual(1113.19, distances[0], places=1)
+    self.assertEquals(distances[0], distances[1])
+    self.accumulator.AssertNoMoreExceptions()
+
+
+class PathwayWalkingTimeTestCase(util.ValidationTestCase):
+  def setUp(self):
+    util.ValidationTestCase.setUp(self)
+    self.schedule = transitfeed.Schedule()
+    # 1113m appart, far too much to walk in 10s + 120s
+    self.stop1 = self.schedule.AddStop(0, 0, "stop 1")
+    self.stop2 = self.schedule.AddStop(0, 0.01, "stop 2")
+
+  def _ValidatePathway(self, pathway_mode):
+    pathway = transitfeed.Pathway(schedule=self.schedule,
+                                  pathway_id="P%s" % pathway_mode,
+                                  from_stop_id=self.stop1.stop_id,
+                                  to_stop_id=self.stop2.stop_id,
+                                  pathway_mode=pathway_mode,
+                                  traversal_time="10")
+    pathway.Validate(self.problems)
+
+  def testWalkwayTooFast(self):
+    self._ValidatePathway("1")
+    e = self.accumulator.PopException("PathwayWalkingSpeedTooFast")
+    self.assertEquals(10, e.transfer_time)
+    self.accumulator.AssertNoMoreExceptions()
+
+  def testStairsTooFast(self):
+    self._ValidatePathway("2")
+    e = self.accumulator.PopException("PathwayWalkingSpeedTooFast")
+    self.assertEquals(10, e.transfer_time)
+    self.accumulator.AssertNoMoreExceptions()
+
+  def testEscalatorIsNotWalked(self):
+    # traversal_time may be set for any pathway_mode, but isn't compared with
+    # a walking speed for escalators.
+    self._ValidatePathway("4")
+    self.accumulator.AssertNoMoreExceptions()
+
+  def testElevatorIsNotWalked(self):
+    self._ValidatePathway("5")
+    self.accumulator.AssertNoMoreExceptions()
@@ -15,22 +15,67 @@
 # limitations under the License.
 
 
+import functools
+
 from .gtfsobjectbase import GtfsObjectBase
 from . import problems as problems_module
 from . import util
 
+# traversal_time values from which an error or a warning is reported
+_VERY_LARGE_TRAVERSAL_TIME = 24 * 3600  # in seconds
+_LARGE_TRAVERSAL_TIME = 3 * 3600        # in seconds
+# Slack added to traversal_time before comparing it with the walking time
+_WALKING_TIME_MARGIN = 120              # in seconds
+_FAST_WALKING_SPEED = 2                 # in meters per second
+# pathway_mode values where people carry themselves: walkway, stairs, fare
+# gate and exit gate. Moving sidewalks, escalators and elevators are left out
+# because their traversal_time says nothing about walking speed.
+_WALKING_PATHWAY_MODES = frozenset((1, 2, 6, 7))
+
+# Returned by _ParseNonNegInt when a value is not a non-negative integer.
+_UNPARSED = object()
+
+def _ParseNonNegInt(value):
+  """Return value converted by util.NonNegIntStringToInt or _UNPARSED."""
+  if isinstance(value, str):
+    return _ParseNonNegIntString(value)
+  try:
+    return util.NonNegIntStringToInt(value)
+  except (TypeError, ValueError):
+    return _UNPARSED
+
+@functools.lru_cache(maxsize=1024)
+def _ParseNonNegIntString(value):
+  """Cached _ParseNonNegInt for strings.
+
+  Feeds reuse a small set of strings for pathway_mode and traversal_time, so
+  the results are cached instead of parsing every row again. Only strings are
+  cached because other values, such as lists, may not be hashable."""
+  try:
+    return util.NonNegIntStringToInt(value)
+  except ValueError:
+    return _UNPARSED
+
 class Pathway(GtfsObjectBase):
   """Represents a pathway in a schedule"""
   _REQUIRED_FIELD_NAMES = ['pathway_id', 'from_stop_id', 'to_stop_id', 'pathway_mode', 'is_bidirectional']
   _FIELD_NAMES = _REQUIRED_FIELD_NAMES + ['length', 'traversal_time', 'stair_count', 'max_slope', 'min_width', 'signposted_as', 'reversed_signposted_as']
   _TABLE_NAME = 'pathways'
   _ID_COLUMNS = ['pathway_id']
+  # Names of the validators run by ValidateBeforeAdd, in order. They are looked
+  # up by name so that subclasses may override any of them.
+  _BEFORE_ADD_VALIDATORS = ('ValidateFromStopIdIsPresent',
+                            'ValidateToStopIdIsPresent',
+                            'ValidatePathwayMode',
+                            'ValidateMinimumPathwayTime')
 
   def __init__(self, schedule=None,  pathway_id=None, from_stop_id=None, to_stop_id=None, pathway_mode=None,
                is_bidirectional=None, traversal_time=None, field_dict=None):
     self._schedule = None
     if field_dict:
       self.__dict__.update(field_dict)
+      pathway_mode = field_dict.get('pathway_mode')
+      traversal_time = field_dict.get('traversal_time')
     else:
       self.pathway_id = pathway_id
       self.from_stop_id = from_stop_id
@@ -39,22 +84,20 @@ class Pathway(GtfsObjectBase):
       self.traversal_time = traversal_time
       self.is_bidirectional = is_bidirectional
 
-    if getattr(self, 'pathway_mode', None) in ("", None):
+    if pathway_mode in ("", None):
       # Use the default, recommended transfer, if attribute is not set or blank
       self.pathway_mode = 2
     else:
-      try:
-        self.pathway_mode = util.NonNegIntStringToInt(self.pathway_mode)
-      except (TypeError, ValueError):
-        pass
-
-    if hasattr(self, 'traversal_time'):
-      try:
-        self.traversal_time = util.NonNegIntStringToInt(self.traversal_time)
-      except (TypeError, ValueError):
-        pass
-    else:
-      self.traversal_time = None
+      pathway_mode = _ParseNonNegInt(pathway_mode)
+      if pathway_mode is not _UNPARSED:
+        self.pathway_mode = pathway_mode
+
+    # A missing traversal_time is left unset so that it isn't added as a
+    # column; __getattr__ returns None for it.
+    if traversal_time is not None:
+      traversal_time = _ParseNonNegInt(traversal_time)
+      if traversal_time is not _UNPARSED:
+        self.traversal_time = traversal_time
     if schedule is not None:
       # Note from Tom, Nov 25, 2009: Maybe calling __init__ with a schedule
       # should output a DeprecationWarning. A schedule factory probably won't
@@ -74,34 +117,35 @@ class Pathway(GtfsObjectBase):
     return True
 
   def ValidatePathwayMode(self, problems):
-    if not util.IsEmpty(self.pathway_mode):
-      if (not isinstance(self.pathway_mode, int)) or \
-          (self.pathway_mode not in list(range(1, 8))):
-        problems.InvalidValue('pathway_mode', self.pathway_mode)
-        return False
+    # __init__ leaves an int in pathway_mode unless the value is malformed, so
+    # only fall back to IsEmpty for values that aren't ints.
+    if isinstance(self.pathway_mode, int):
+      valid = 1 <= self.pathway_mode <= 7
+    else:
+      valid = util.IsEmpty(self.pathway_mode)
+    if not valid:
+      problems.InvalidValue('pathway_mode', self.pathway_mode)
+      return False
     return True
 
   def ValidateMinimumPathwayTime(self, problems):
-    if not util.IsEmpty(self.traversal_time):
-      if self.pathway_mode != 2:
-        problems.MinimumPathwayTimeSetWithInvalidPathwayMode(
-            self.pathway_mode)
-
+    traversal_time_is_int = isinstance(self.traversal_time, int)
+    if traversal_time_is_int or not util.IsEmpty(self.traversal_time):
       # If traversal_time is negative, equal to or bigger than 24h, issue
       # an error. If smaller than 24h but bigger than 3h issue a warning.
       # These errors are not blocking, and should not prevent the transfer
       # from being added to the schedule.
-      if (isinstance(self.traversal_time, int)):
+      if traversal_time_is_int:
         if self.traversal_time < 0:
           problems.InvalidValue('traversal_time', self.traversal_time,
                                 reason="This field cannot contain a negative " \
                                        "value.")
-        elif self.traversal_time >= 24*3600:
+        elif self.traversal_time >= _VERY_LARGE_TRAVERSAL_TIME:
           problems.InvalidValue('traversal_time', self.traversal_time,
                                 reason="The value is very large for a " \
                                        "transfer time and most likely " \
                                        "indicates an error.")
-        elif self.traversal_time >= 3*3600:
+        elif self.traversal_time >= _LARGE_TRAVERSAL_TIME:
           problems.InvalidValue('traversal_time', self.traversal_time,
                                 type=problems_module.TYPE_WARNING,
                                 reason="The value is large for a transfer " \
@@ -116,25 +160,27 @@ class Pathway(GtfsObjectBase):
     return True
 
   def GetPathwayDistance(self):
-    from_stop = self._schedule.stops[self.from_stop_id]
-    to_stop = self._schedule.stops[self.to_stop_id]
+    stops = self._schedule.stops
+    from_stop = stops[self.from_stop_id]
+    to_stop = stops[self.to_stop_id]
     distance = util.ApproximateDistanceBetweenStops(from_stop, to_stop)
     return distance
 
   def ValidateFromStopIdIsValid(self, problems):
-    if self.from_stop_id not in list(self._schedule.stops.keys()):
+    if self.from_stop_id not in self._schedule.stops:
       problems.InvalidValue('from_stop_id', self.from_stop_id)
       return False
     return True
 
   def ValidateToStopIdIsValid(self, problems):
-    if self.to_stop_id not in list(self._schedule.stops.keys()):
+    if self.to_stop_id not in self._schedule.stops:
       problems.InvalidValue('to_stop_id', self.to_stop_id)
       return False
     return True
 
-  def ValidatePathwayDistance(self, problems):
-    distance = self.GetPathwayDistance()
+  def ValidatePathwayDistance(self, problems, distance=None):
+    if distance is None:
+      distance = self.GetPathwayDistance()
 
     if distance > 10000:
       problems.PathwayDistanceTooBig(self.from_stop_id,
@@ -146,8 +192,13 @@ class Pathway(GtfsObjectBase):
                                       distance,
                                       type=problems_module.TYPE_WARNING)
 
-  def ValidatePathwayWalkingTime(self, problems):
-    if util.IsEmpty(self.traversal_time):
+  def ValidatePathwayWalkingTime(self, problems, distance=None):
+    if self.pathway_mode not in _WALKING_PATHWAY_MODES:
+      return
+
+    # ValidateMinimumPathwayTime only accepts an empty or integer
+    # traversal_time, so anything that isn't an int here is empty.
+    if not isinstance(self.traversal_time, int):
       return
 
     if self.traversal_time < 0:
@@ -155,36 +206,38 @@ class Pathway(GtfsObjectBase):
       # to calculate walking speed with negative times.
       return
 
-    distance = self.GetPathwayDistance()
+    if distance is None:
+      distance = self.GetPathwayDistance()
     # If traversal_time + 120s isn't enough for someone walking very fast
     # (2m/s) then issue a warning.
     #
     # Stops that are close together (less than 240m appart) never trigger this
     # warning, regardless of traversal_time.
-    FAST_WALKING_SPEED= 2 # 2m/s
-    if self.traversal_time + 120 < distance / FAST_WALKING_SPEED:
+    if (self.traversal_time + _WALKING_TIME_MARGIN <
+        distance / _FAST_WALKING_SPEED):
       problems.PathwayWalkingSpeedTooFast(from_stop_id=self.from_stop_id,
                                            to_stop_id=self.to_stop_id,
                                            transfer_time=self.traversal_time,
                                            distance=distance)
 
   def ValidateBeforeAdd(self, problems):
-    result = True
-    result = self.ValidateFromStopIdIsPresent(problems) and result
-    result = self.ValidateToStopIdIsPresent(problems) and result
-    result = self.ValidatePathwayMode(problems) and result
-    result = self.ValidateMinimumPathwayTime(problems) and result
-    return result
+    # Every validator runs, even after one has failed, so that all problems
+    # are reported.
+    failed = False
+    for name in self._BEFORE_ADD_VALIDATORS:
+      failed |= not getattr(self, name)(problems)
+    return not failed
 
   def ValidateAfterAdd(self, problems):
-    valid_stop_ids = True
-    valid_stop_ids = self.ValidateFromStopIdIsValid(problems) and valid_stop_ids
-    valid_stop_ids = self.ValidateToStopIdIsValid(problems) and valid_stop_ids
+    invalid_stop_ids = not self.ValidateFromStopIdIsValid(problems)
+    invalid_stop_ids |= not self.ValidateToStopIdIsValid(problems)
     # We need both stop IDs to be valid to able to validate their distance and
     # the walking time between them
-    if valid_stop_ids:
-      self.ValidatePathwayDistance(problems)
-      self.ValidatePathwayWalkingTime(problems)
+    if not invalid_stop_ids:
+      # Both checks need the distance, so only compute it once.
+      distance = self.GetPathwayDistance()
+      self.ValidatePathwayDistance(problems, distance)
+      self.ValidatePathwayWalkingTime(problems, distance)
 
   def Validate(self,
                problems=problems_module.default_problem_reporter):
@@ -192,7 +245,8 @@ class Pathway(GtfsObjectBase):
       self.ValidateAfterAdd(problems)
 
   def _ID(self):
-    return tuple(self[i] for i in self._ID_COLUMNS)
+    # _ID_COLUMNS only contains pathway_id
+    return (self['pathway_id'],)
 
   def AddToSchedule(self, schedule, problems):
     schedule.AddPathwayObject(self, problems)
@@ -317,72 +317,64 @@ class ProblemReporter(object):
                                         context2=self._context, type=type)
         self.AddToAccumulator(e)
 
-def PathwayDistanceTooBig(self, from_stop_id, to_stop_id, distance,
-                          context=None, type=TYPE_ERROR):
-    e = PathwayDistanceTooBig(from_stop_id=from_stop_id, to_stop_id=to_stop_id,
-                              distance=distance, context=context,
-                              context2=self._context, type=type)
-    self.AddToAccumulator(e)
-
-def PathwayWalkingSpeedTooFast(self, from_stop_id, to_stop_id, distance,
-                               transfer_time, context=None,
-                               type=TYPE_WARNING):
-    e = PathwayWalkingSpeedTooFast(from_stop_id=from_stop_id,
-                                   transfer_time=transfer_time,
-                                   distance=distance,
-                                   to_stop_id=to_stop_id, context=context,
-                                   context2=self._context, type=type)
-    self.AddToAccumulator(e)
-
-def OtherProblem(self, description, context=None, type=TYPE_ERROR):
-    e = OtherProblem(description=description,
-                     context=context, context2=self._context, type=type)
-    self.AddToAccumulator(e)
-
-def TooManyDaysWithoutService(self,
-                              first_day_without_service,
-                              last_day_without_service,
-                              consecutive_days_without_service,
-                              context=None,
-                              type=TYPE_WARNING):
-    e = TooManyDaysWithoutService(
-        first_day_without_service=first_day_without_service,
-        last_day_without_service=last_day_without_service,
-        consecutive_days_without_service=consecutive_days_without_service,
-        context=context,
-        context2=self._context,
-        type=type)
-    self.AddToAccumulator(e)
-
-def MinimumTransferTimeSetWithInvalidTransferType(self,
-                                                  transfer_type=None,
-                                                  context=None,
-                                                  type=TYPE_ERROR):
-    e = MinimumTransferTimeSetWithInvalidTransferType(context=context,
-                                                      context2=self._context, transfer_type=transfer_type, type=type)
-    self.AddToAccumulator(e)
-
-def TraversalTimeWithInvalidPathwayMode(self,
-                                        pathway_mode=None,
-                                        context=None,
-                                        type=TYPE_ERROR):
-    e = TraversalTimeWithInvalidPathwayMode(context=context,
-                                            context2=self._context, pathway_mode=pathway_mode, type=type)
-    self.AddToAccumulator(e)
-
-
-def TooManyConsecutiveStopTimesWithSameTime(self,
-                                            trip_id,
-                                            number_of_stop_times,
-                                            time_in_secs,
-                                            type=TYPE_WARNING):
-    e = TooManyConsecutiveStopTimesWithSameTime(trip_id=trip_id,
-                                                number_of_stop_times=number_of_stop_times,
-                                                stop_time=util.FormatSecondsSinceMidnight(time_in_secs),
-                                                context=None,
-                                                context2=self._context,
-                                                type=type)
-    self.AddToAccumulator(e)
+    def PathwayDistanceTooBig(self, from_stop_id, to_stop_id, distance,
+                              context=None, type=TYPE_ERROR):
+        e = PathwayDistanceTooBig(from_stop_id=from_stop_id, to_stop_id=to_stop_id,
+                                  distance=distance, context=context,
+                                  context2=self._context, type=type)
+        self.AddToAccumulator(e)
+
+    def PathwayWalkingSpeedTooFast(self, from_stop_id, to_stop_id, distance,
+                                   transfer_time, context=None,
+                                   type=TYPE_WARNING):
+        e = PathwayWalkingSpeedTooFast(from_stop_id=from_stop_id,
+                                       transfer_time=transfer_time,
+                                       distance=distance,
+                                       to_stop_id=to_stop_id, context=context,
+                                       context2=self._context, type=type)
+        self.AddToAccumulator(e)
+
+    def OtherProblem(self, description, context=None, type=TYPE_ERROR):
+        e = OtherProblem(description=description,
+                         context=context, context2=self._context, type=type)
+        self.AddToAccumulator(e)
+
+    def TooManyDaysWithoutService(self,
+                                  first_day_without_service,
+                                  last_day_without_service,
+                                  consecutive_days_without_service,
+                                  context=None,
+                                  type=TYPE_WARNING):
+        e = TooManyDaysWithoutService(
+            first_day_without_service=first_day_without_service,
+            last_day_without_service=last_day_without_service,
+            consecutive_days_without_service=consecutive_days_without_service,
+            context=context,
+            context2=self._context,
+            type=type)
+        self.AddToAccumulator(e)
+
+    def MinimumTransferTimeSetWithInvalidTransferType(self,
+                                                      transfer_type=None,
+                                                      context=None,
+                                                      type=TYPE_ERROR):
+        e = MinimumTransferTimeSetWithInvalidTransferType(context=context,
+                                                          context2=self._context, transfer_type=transfer_type, type=type)
+        self.AddToAccumulator(e)
+
+
+    def TooManyConsecutiveStopTimesWithSameTime(self,
+                                                trip_id,
+                                                number_of_stop_times,
+                                                time_in_secs,
+                                                type=TYPE_WARNING):
+        e = TooManyConsecutiveStopTimesWithSameTime(trip_id=trip_id,
+                                                    number_of_stop_times=number_of_stop_times,
+                                                    stop_time=util.FormatSecondsSinceMidnight(time_in_secs),
+                                                    context=None,
+                                                    context2=self._context,
+                                                    type=type)
+        self.AddToAccumulator(e)
 
 class ProblemAccumulatorInterface(object):
     """The base class for Problem Accumulators, which defines their interface."""
@@ -789,6 +781,15 @@ class TransferWalkingSpeedTooFast(ExceptionWithContext):
                  "%(to_stop_id)s would need to walk %(distance)s meters in " \
                  "%(transfer_time)s seconds."
 
+class PathwayDistanceTooBig(ExceptionWithContext):
+    ERROR_TEXT = "Pathway from stop %(from_stop_id)s to stop " \
+                 "%(to_stop_id)s has a distance of %(distance)s meters."
+
+class PathwayWalkingSpeedTooFast(ExceptionWithContext):
+    ERROR_TEXT = "Riders using the pathway from stop %(from_stop_id)s to stop " \
+                 "%(to_stop_id)s would need to walk %(distance)s meters in " \
+                 "%(transfer_time)s seconds."
+
 class TooManyConsecutiveStopTimesWithSameTime(ExceptionWithContext):
     ERROR_TEXT = "Trip %(trip_id)s has %(number_of_stop_times)d consecutive " \
                  "stop times all with the same arrival/departure time: " \